@@ -37,23 +37,22 @@ def _get_punctuators():
         for token in sorted(punctuators, key=len, reverse=True))
 
 
+# Repetitions in these regexps are written in the "unrolled loop" style
+# `normal* (?: special normal* )*` rather than as `(?: normal | special )*`.
+# Both match the same strings, but the unrolled form lets `re` scan runs of
+# ordinary characters with a single character-class loop, instead of trying
+# an alternation at every character and backtracking through it.
 TOKEN_RE = re.compile(r'''(?x)
-  (?:
-      # WhiteSpace
-      [\ \t\v\r\n\u00a0\u2028\u2029\ufeff]
-      # SingleLineComment
-    | // [^\r\n\u2028\u2029]* (?= [\r\n\u2028\u2029] | \Z )
-      # MultiLineComment
-    | /\*  (?: [^*] | \*+[^/] )*  \*+/
-  )*
+  # WhiteSpace and LineTerminators. Comments are skipped by
+  # JSLexer._match_past_comments.
+  [\ \t\v\r\n\u00a0\u2028\u2029\ufeff]*
   (
-      # Incomplete MultiLineComment
-      /\*  (?: [^*] | \*+[^/] )*  \**
-    | # Incomplete SingleLineComment
-      // [^\r\n\u2028\u2029]*
+      # Start of a comment
+      / [/*]
     | # IdentifierName
-      (?: [$_A-Za-z]     | \\ u [0-9A-Fa-f]{4} | \\ u \{ [0-9A-Fa-f]+ \})
-      (?: [$_0-9A-Za-z]  | \\ u [0-9A-Fa-f]{4} | \\ u \{ [0-9A-Fa-f]+ \})*
+      (?: [$_A-Za-z]     | \\ u (?: [0-9A-Fa-f]{4} | \{ [0-9A-Fa-f]+ \} ))
+      [$_0-9A-Za-z]*
+      (?: \\ u (?: [0-9A-Fa-f]{4} | \{ [0-9A-Fa-f]+ \} ) [$_0-9A-Za-z]* )*
     | # NumericLiteral
       [0-9][0-9A-Za-z]*(?:\.[0-9A-Za-z]*)?
     | \.[0-9][0-9A-Za-z]*
@@ -66,40 +65,50 @@ TOKEN_RE = re.compile(r'''(?x)
     | # StringLiteral
       '
         # SingleStringCharacters
+        # SourceCharacter but not one of ' or \\ or LineTerminator
+        # but also allow LINE SEPARATOR or PARAGRAPH SEPARATOR
+        [^'\\\r\n]*
         (?:
-            # SourceCharacter but not one of ' or \\ or LineTerminator
-            # but also allow LINE SEPARATOR or PARAGRAPH SEPARATOR
-            [^'\\\r\n]
-          | \\ [^0-9xu\r\n\u2028\u2029]  # CharacterEscapeSequence
-          | \\ x [0-9A-Fa-f]{2}          # HexEscapeSequence
-          | \\ u [0-9A-Fa-f]{4}          # UnicodeEscapeSequence
-          | \\ u \{ [0-9A-Fa-f]+ \}
-          | \\\r\n?                      # LineContinuation
-          | \\[\n\u2028\u2029]
+            \\
+            (?:
+                [^0-9xu\r\n\u2028\u2029]  # CharacterEscapeSequence
+              | x [0-9A-Fa-f]{2}          # HexEscapeSequence
+              | u [0-9A-Fa-f]{4}          # UnicodeEscapeSequence
+              | u \{ [0-9A-Fa-f]+ \}
+              | \r\n?                     # LineContinuation
+              | [\n\u2028\u2029]
+            )
+            [^'\\\r\n]*
         )*
       '
     | "
         # DoubleStringCharacters
+        # SourceCharacter but not one of " or \\ or LineTerminator
+        # but also allow LINE SEPARATOR or PARAGRAPH SEPARATOR
+        [^"\\\r\n]*
         (?:
-            # SourceCharacter but not one of " or \\ or LineTerminator
-            # but also allow LINE SEPARATOR or PARAGRAPH SEPARATOR
-            [^"\\\r\n]
-          | \\ [^0-9xu\r\n\u2028\u2029]  # CharacterEscapeSequence
-          | \\ x [0-9A-Fa-f]{2}          # HexEscapeSequence
-          | \\ u [0-9A-Fa-f]{4}          # UnicodeEscapeSequence
-          | \\ u \{ [0-9A-Fa-f]+ \}
-          | \\\r\n?                      # LineContinuation
-          | \\[\n\u2028\u2029]
+            \\
+            (?:
+                [^0-9xu\r\n\u2028\u2029]  # CharacterEscapeSequence
+              | x [0-9A-Fa-f]{2}          # HexEscapeSequence
+              | u [0-9A-Fa-f]{4}          # UnicodeEscapeSequence
+              | u \{ [0-9A-Fa-f]+ \}
+              | \r\n?                     # LineContinuation
+              | [\n\u2028\u2029]
+            )
+            [^"\\\r\n]*
         )*
       "
     | # Template
-      ` (?: [^`\\$] | \\. )* (?: \${ | ` )
+      ` [^`\\$]* (?: \\. [^`\\$]* )* (?: \${ | ` )
     | # illegal character or end of input (this branch matches no characters)
   )
 '''.replace("<INSERT_PUNCTUATORS>", _get_punctuators()))
 
 DIV_RE = re.compile(r'(/=?)')
 
+LINE_TERMINATOR_RE = re.compile(r'[\r\n\u2028\u2029]')
+
 REGEXP_RE = re.compile(r'''(?x)
 (
     /
@@ -203,15 +212,49 @@ ECMASCRIPT_CONDITIONAL_KEYWORDS = [
 # as a keyword in the grammar: `enum`.
 ALL_KEYWORDS = set(ECMASCRIPT_FULL_KEYWORDS + ECMASCRIPT_CONDITIONAL_KEYWORDS)
 
+# The terminal for each keyword, so that JSLexer._match classifies a word with
+# a single dict lookup. Most keywords are their own terminal; the literals
+# `null`, `true` and `false` are not.
+KEYWORD_TERMINALS = {kw: kw for kw in ALL_KEYWORDS}
+KEYWORD_TERMINALS.update(null='NullLiteral', true='BooleanLiteral', false='BooleanLiteral')
+
 
 class JSLexer(jsparagus.lexer.FlatStringLexer):
     """Vague approximation of an ECMAScript lexer. """
     def __init__(self, parser, filename=None):
         super().__init__(parser, filename)
 
+    def _match_past_comments(self, closing):
+        """Match TOKEN_RE at self.point, skipping over any comments.
+
+        Returns None if the source ends inside a MultiLineComment and we are
+        not closing (the rest of the comment may arrive in the next chunk).
+        """
+        src = self.src
+        match = TOKEN_RE.match(src, self.point)
+        token = match.group(1)
+        while token == '/*' or token == '//':
+            # Search for the end of the comment with str methods, rather
+            # than having the regexp engine step through each character.
+            if token == '//':
+                end = LINE_TERMINATOR_RE.search(src, match.end())
+                point = len(src) if end is None else end.start()
+            else:
+                point = src.find('*/', match.end())
+                if point == -1:
+                    if not closing:
+                        return None
+                    self.point = len(src)
+                    self.throw("incomplete comment at end of source")
+                point += 2
+            match = TOKEN_RE.match(src, point)
+            token = match.group(1)
+        return match
+
     def _match(self, closing):
-        match = TOKEN_RE.match(self.src, self.point)
-        assert match is not None
+        match = self._match_past_comments(closing)
+        if match is None:
+            return None
 
         if match.end() == len(self.src) and not closing:
             # The current token runs right up against the end of the current
@@ -233,27 +276,21 @@ class JSLexer(jsparagus.lexer.FlatStringLexer):
 
         c = token[0]
         t = None
-        if c.isdigit() or c == '.' and token != '.':
-            t = 'NumericLiteral'
+        # The branches are ordered by how often they are taken. In jQuery, for
+        # example, punctuators are 56% of the tokens and names and keywords
+        # 39%; numbers, strings, regexps and templates make up the rest.
+        if c in '{}()[];,~?:<>=!+-*%&|^':
+            # TODO: TemplateTail, which starts with `}`
+            t = token
         elif c.isalpha() or c in '$_':
-            if token in ALL_KEYWORDS:  # TODO support strict mode
-                if token == 'null':
-                    t = 'NullLiteral'
-                elif token in ('true', 'false'):
-                    t = 'BooleanLiteral'
-                else:
-                    t = token
-            else:
-                t = 'Name'
+            t = KEYWORD_TERMINALS.get(token, 'Name')  # TODO support strict mode
+        elif c.isdigit() or c == '.' and token != '.':
+            t = 'NumericLiteral'
+        elif c == '.':
+            t = token
+        elif c == '"' or c == "'":
+            t = 'StringLiteral'
         elif c == '/':
-            if token.startswith(('/*', '//')):
-                # Incomplete comment. (In non-closing mode, this is handled
-                # above, immediately after the match.)
-                assert match.end() == len(self.src)
-                assert closing
-                self.point = len(self.src)
-                self.throw("incomplete comment at end of source")
-
             # We choose RegExp vs. division based on what the parser can
             # accept, a literal implementation of the spec.
             #
@@ -284,13 +321,6 @@ class JSLexer(jsparagus.lexer.FlatStringLexer):
                 t = 'NoSubstitutionTemplate'
             else:
                 t = 'TemplateHead'
-        elif c == '"' or c == "'":
-            t = 'StringLiteral'
-        elif c == '}':
-            # TODO: TemplateTail
-            t = token
-        elif c in '{()[];,~?:.<>=!+-*%&|^':
-            t = token
         else:
             assert False
 
@@ -311,5 +341,6 @@ class JSLexer(jsparagus.lexer.FlatStringLexer):
         return any(c in ws_between for c in '\r\n\u2028\u2029')
 
     def can_close(self):
-        match = TOKEN_RE.match(self.src)
-        return match.group(1) == '' and self.parser.can_close()
+        match = self._match_past_comments(False)
+        return (match is not None and match.group(1) == ''
+                and self.parser.can_close())
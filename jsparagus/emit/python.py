@@ -11,7 +11,7 @@ from ..actions import (Accept, Action, CheckNotOnNewLine, FilterFlag, FilterStat
 from ..runtime import ErrorToken, ErrorTokenClass
 from ..ordered import OrderedSet
 from ..lr0 import Term
-from ..parse_table import StateId, ParseTable
+from ..parse_table import StateAndTransitions, StateId, ParseTable
 
 
 def method_name_to_python(name: str) -> str:
@@ -19,75 +19,119 @@ def method_name_to_python(name: str) -> str:
 
 
 def write_python_parse_table(out: io.TextIOBase, parse_table: ParseTable) -> None:
+    # The generated module is collected in a list of fragments and written to
+    # `out` in one call at the end.
+    buf: typing.List[str] = []
+    write = buf.append
+
     # Disable MyPy type checking for everything in this module.
-    out.write("# type: ignore\n\n")
+    write("# type: ignore\n\n")
 
-    out.write("from jsparagus import runtime\n")
+    write("from jsparagus import runtime\n")
     if any(isinstance(key, Nt) for key in parse_table.nonterminals):
-        out.write(
+        write(
             "from jsparagus.runtime import (Nt, InitNt, End, ErrorToken, StateTermValue,\n"
             "                               ShiftError, ShiftAccept)\n")
-    out.write("\n")
+    write("\n")
 
     methods: OrderedSet[typing.Tuple[str, int]] = OrderedSet()
 
-    def write_epsilon_transition(indent: str, dest_idx: StateId):
+    # Nonterminals are bound to module-level names, so that the values pushed
+    # by the action functions use the very objects which are keys of the
+    # `actions` rows. Looking them up then succeeds on the identity check,
+    # without calling Nt.__eq__.
+    nt_names: typing.Dict[Nt, str] = {}
+
+    def nt_name(nt: Nt) -> str:
+        name = nt_names.get(nt)
+        if name is None:
+            name = nt_names[nt] = "nt_{}".format(len(nt_names))
+        return name
+
+    def repr_term(term: typing.Union[Term, ErrorTokenClass]) -> str:
+        if isinstance(term, Nt):
+            return nt_name(term)
+        return repr(term)
+
+    def write_epsilon_transition(indent: str, dest_idx: StateId,
+                                 dest_var: typing.Optional[str] = None):
+        # If `dest_var` is given, it is the name of a variable holding the
+        # destination state, computed at run time. `dest_idx` is then one of
+        # the possible destinations, all of which must be of the same kind.
         dest = parse_table.states[dest_idx]
         if dest.epsilon != []:
             assert dest.index < len(parse_table.states)
             # This is a transition to an action.
             args = ""
             for i in range(dest.arguments):
-                out.write("{}r{} = parser.replay.pop()\n".format(indent, i))
+                write("{}r{} = parser.replay.pop()\n".format(indent, i))
                 args += ", r{}".format(i)
-            out.write("{}state_{}_actions(parser, lexer{})\n".format(indent, dest.index, args))
+            if dest_var is None:
+                fn = "state_{}_actions".format(dest.index)
+            else:
+                fn = "actions[{}]".format(dest_var)
+            write("{}{}(parser, lexer{})\n".format(indent, fn, args))
         else:
             # This is a transition to a shift.
             assert dest.arguments == 0
-            out.write("{}top = parser.stack.pop()\n".format(indent))
-            out.write("{}top = StateTermValue({}, top.term, top.value, top.new_line)\n"
-                      .format(indent, dest.index))
-            out.write("{}parser.stack.append(top)\n".format(indent))
+            write("{}top = parser.stack[-1]\n".format(indent))
+            write("{}parser.stack[-1] = StateTermValue({}, top.term, top.value, top.new_line)\n"
+                  .format(indent, dest.index if dest_var is None else dest_var))
+
+    def dispatch_on_top_state(state: StateAndTransitions) -> bool:
+        """True if all edges of `state` are FilterStates leading to the same
+        kind of destination, so that a jump table can replace the chain of
+        `if parser.top_state() in [...]` tests."""
+        edges = list(state.edges())
+        if len(edges) < 2 or not all(isinstance(act, FilterStates) for act, _ in edges):
+            return False
+        kinds = set((parse_table.states[dest].epsilon != [],
+                     parse_table.states[dest].arguments)
+                    for _, dest in edges)
+        return len(kinds) == 1
 
     def write_action(act: Action, indent: str = "") -> typing.Tuple[str, bool]:
         assert not act.is_inconsistent()
         if isinstance(act, Replay):
             for s in act.replay_steps:
-                out.write("{}parser.replay_action({})\n".format(indent, s))
+                write("{}parser.replay_action({})\n".format(indent, s))
             return indent, True
         if isinstance(act, (Unwind, Reduce)):
             stack_diff = act.update_stack_with()
+            assert isinstance(stack_diff.nt, Nt)
+            # Move the replayed terms and then the reduced nonterminal straight
+            # onto parser.replay, without building an intermediate list.
             replay = stack_diff.replay
-            out.write("{}replay = []\n".format(indent))
             while replay > 0:
                 replay -= 1
-                out.write("{}replay.append(parser.stack.pop())\n".format(indent))
-            out.write("{}replay.append(StateTermValue(0, {}, value, False))\n"
-                      .format(indent, repr(stack_diff.nt)))
-            if stack_diff.pop > 0:
-                out.write("{}del parser.stack[-{}:]\n".format(indent, stack_diff.pop))
-            out.write("{}parser.replay.extend(replay)\n".format(indent))
+                write("{}parser.replay.append(parser.stack.pop())\n".format(indent))
+            if stack_diff.pop == 1:
+                write("{}parser.stack.pop()\n".format(indent))
+            elif stack_diff.pop > 0:
+                write("{}del parser.stack[-{}:]\n".format(indent, stack_diff.pop))
+            write("{}parser.replay.append(StateTermValue(0, {}, value, False))\n"
+                  .format(indent, nt_name(stack_diff.nt)))
             return indent, act.follow_edge()
         if isinstance(act, Accept):
-            out.write("{}raise ShiftAccept()\n".format(indent))
+            write("{}raise ShiftAccept()\n".format(indent))
             return indent, False
         if isinstance(act, Lookahead):
             raise ValueError("Unexpected Lookahead action")
         if isinstance(act, CheckNotOnNewLine):
-            out.write("{}if not parser.check_not_on_new_line(lexer, {}):\n".format(indent, -act.offset))
-            out.write("{}    return\n".format(indent))
+            write("{}if not parser.check_not_on_new_line(lexer, {}):\n".format(indent, -act.offset))
+            write("{}    return\n".format(indent))
             return indent, True
         if isinstance(act, FilterStates):
-            out.write("{}if parser.top_state() in [{}]:\n".format(indent, ", ".join(map(str, act.states))))
+            write("{}if parser.top_state() in [{}]:\n".format(indent, ", ".join(map(str, act.states))))
             return indent + "    ", True
         if isinstance(act, FilterFlag):
-            out.write("{}if parser.flags[{}][-1] == {}:\n".format(indent, act.flag, act.value))
+            write("{}if parser.flags[{}][-1] == {}:\n".format(indent, act.flag, act.value))
             return indent + "    ", True
         if isinstance(act, PushFlag):
-            out.write("{}parser.flags[{}].append({})\n".format(indent, act.flag, act.value))
+            write("{}parser.flags[{}].append({})\n".format(indent, act.flag, act.value))
             return indent, True
         if isinstance(act, PopFlag):
-            out.write("{}parser.flags[{}].pop()\n".format(indent, act.flag))
+            write("{}parser.flags[{}].pop()\n".format(indent, act.flag))
             return indent, True
         if isinstance(act, FunCall):
             enclosing_call_offset = act.offset
@@ -116,10 +160,10 @@ def write_python_parse_table(out: io.TextIOBase, parse_table: ParseTable) -> Non
 
             if act.method == "id":
                 assert len(act.args) == 1
-                out.write("{}{} = {}\n".format(indent, act.set_to, next(map_with_offset(act.args))))
+                write("{}{} = {}\n".format(indent, act.set_to, next(map_with_offset(act.args))))
             else:
                 methods.add((act.method, len(act.args)))
-                out.write("{}{} = parser.methods.{}({})\n".format(
+                write("{}{} = parser.methods.{}({})\n".format(
                     indent, act.set_to, method_name_to_python(act.method),
                     ", ".join(map_with_offset(act.args))
                 ))
@@ -131,6 +175,7 @@ def write_python_parse_table(out: io.TextIOBase, parse_table: ParseTable) -> Non
         raise ValueError("Unknown action type")
 
     # Write code correspond to each action which has to be performed.
+    dispatch_tables: typing.List[typing.Tuple[StateId, typing.Dict[StateId, StateId]]] = []
     for i, state in enumerate(parse_table.states):
         assert i == state.index
         if state.epsilon == []:
@@ -138,22 +183,42 @@ def write_python_parse_table(out: io.TextIOBase, parse_table: ParseTable) -> Non
         args = []
         for j in range(state.arguments):
             args.append("a{}".format(j))
-        out.write("def state_{}_actions(parser, lexer{}):\n".format(
+        write("def state_{}_actions(parser, lexer{}):\n".format(
             i, "".join(map(lambda s: ", " + s, args))))
         if state.arguments > 0:
-            out.write("    parser.replay.extend([{}])\n".format(", ".join(reversed(args))))
+            write("    parser.replay.extend([{}])\n".format(", ".join(reversed(args))))
         term, dest = next(iter(state.epsilon))
         if term.update_stack():
             # If we Unwind, make sure all elements are replayed on the stack before starting.
-            out.write("    # {}\n".format(term))
+            write("    # {}\n".format(term))
             stack_diff = term.update_stack_with()
             replay = stack_diff.replay
             if stack_diff.pop + replay >= 0:
                 while replay < 0:
                     replay += 1
-                    out.write("    parser.stack.append(parser.replay.pop())\n")
-        out.write("{}\n".format(parse_table.debug_context(i, "\n", "    # ")))
-        out.write("    value = None\n")
+                    write("    parser.stack.append(parser.replay.pop())\n")
+        write("{}\n".format(parse_table.debug_context(i, "\n", "    # ")))
+        write("    value = None\n")
+        if dispatch_on_top_state(state):
+            # Jump table: find the destination with a single dict lookup.
+            table: typing.Dict[StateId, StateId] = {}
+            for act, dest in state.edges():
+                assert isinstance(act, FilterStates)
+                for s in act.states:
+                    # The chain of tests would take the first edge listing `s`,
+                    # which a table cannot express, so the lists must not overlap.
+                    assert s not in table, "FilterStates edges overlap on state {}".format(s)
+                    table[s] = dest
+            dispatch_tables.append((i, table))
+            # When no edge matches, return without a transition, exactly like
+            # falling off the end of the chain of tests.
+            write("    try:\n")
+            write("        dest = state_{}_dispatch[parser.top_state()]\n".format(i))
+            write("    except KeyError:\n")
+            write("        return\n")
+            write_epsilon_transition("    ", next(state.edges())[1], "dest")
+            write("    return\n\n")
+            continue
         for action, dest in state.edges():
             assert isinstance(action, Action)
             try:
@@ -165,26 +230,45 @@ def write_python_parse_table(out: io.TextIOBase, parse_table: ParseTable) -> Non
                 raise
             if fallthrough:
                 write_epsilon_transition(indent, dest)
-            out.write("{}return\n".format(indent))
-        out.write("\n")
+            write("{}return\n".format(indent))
+        write("\n")
 
-    out.write("actions = [\n")
-    for i, state in enumerate(parse_table.states):
-        assert i == state.index
-        out.write("    # {}.\n{}\n".format(i, parse_table.debug_context(i, "\n", "    # ")))
+    # Shift states are written as dicts keyed by terminal and nonterminal,
+    # rather than as a flat `state * width + term_id` array like the SHIFT
+    # table of the Rust backend. The lexer hands the parser terminal names,
+    # so finding a term_id would cost the same hash lookup that the row dict
+    # does, and the goto on a reduced Nt finds its key by identity.
+    rows = []
+    for state in parse_table.states:
         if state.epsilon == []:
             row: typing.Dict[typing.Union[Term, ErrorTokenClass], StateId]
             row = {term: dest for term, dest in state.edges()}
             for err, dest in state.errors.items():
                 del row[err]
                 row[ErrorToken] = dest
-            out.write("    " + repr(row) + ",\n")
+            rows.append("{" + ", ".join(
+                "{}: {!r}".format(repr_term(term), dest)
+                for term, dest in row.items()) + "}")
         else:
-            out.write("    state_{}_actions,\n".format(i))
-        out.write("\n")
-    out.write("]\n\n")
+            rows.append("state_{}_actions".format(state.index))
+
+    for nt, name in nt_names.items():
+        write("{} = {!r}\n".format(name, nt))
+    if nt_names:
+        write("\n")
+
+    for i, table in dispatch_tables:
+        write("state_{}_dispatch = {}\n\n".format(i, repr(table)))
+
+    write("actions = [\n")
+    for i, state in enumerate(parse_table.states):
+        assert i == state.index
+        write("    # {}.\n{}\n".format(i, parse_table.debug_context(i, "\n", "    # ")))
+        write("    {},\n".format(rows[i]))
+        write("\n")
+    write("]\n\n")
 
-    out.write("error_codes = [\n")
+    write("error_codes = [\n")
 
     def repr_code(symb: typing.Optional[ErrorSymbol]) -> str:
         if isinstance(symb, ErrorSymbol):
@@ -194,12 +278,12 @@ def write_python_parse_table(out: io.TextIOBase, parse_table: ParseTable) -> Non
     SLICE_LEN = 16
     for i in range(0, len(parse_table.states), SLICE_LEN):
         states_slice = parse_table.states[i:i + SLICE_LEN]
-        out.write("    {}\n".format(
+        write("    {}\n".format(
             " ".join(repr_code(state.get_error_symbol()) + ","
                      for state in states_slice)))
-    out.write("]\n\n")
+    write("]\n\n")
 
-    out.write("goal_nt_to_init_state = {}\n\n".format(
+    write("goal_nt_to_init_state = {}\n\n".format(
         repr({nt.name: goal for nt, goal in parse_table.named_goals})
     ))
 
@@ -210,19 +294,21 @@ def write_python_parse_table(out: io.TextIOBase, parse_table: ParseTable) -> Non
         default_goal = ''
 
     # Class used to provide default methods when not defined by the caller.
-    out.write("class DefaultMethods:\n")
+    write("class DefaultMethods:\n")
     for method, arglen in methods:
         act_args = ", ".join("x{}".format(i) for i in range(arglen))
         name = method_name_to_python(method)
-        out.write("    def {}(self, {}):\n".format(name, act_args))
-        out.write("        return ({}, {})\n".format(repr(name), act_args))
+        write("    def {}(self, {}):\n".format(name, act_args))
+        write("        return ({}, {})\n".format(repr(name), act_args))
     if not methods:
-        out.write("    pass\n")
-    out.write("\n")
-
-    out.write("class Parser(runtime.Parser):\n")
-    out.write("    def __init__(self, goal{}, builder=None):\n".format(default_goal))
-    out.write("        if builder is None:\n")
-    out.write("            builder = DefaultMethods()\n")
-    out.write("        super().__init__(actions, error_codes, goal_nt_to_init_state[goal], builder)\n")
-    out.write("\n")
+        write("    pass\n")
+    write("\n")
+
+    write("class Parser(runtime.Parser):\n")
+    write("    def __init__(self, goal{}, builder=None):\n".format(default_goal))
+    write("        if builder is None:\n")
+    write("            builder = DefaultMethods()\n")
+    write("        super().__init__(actions, error_codes, goal_nt_to_init_state[goal], builder)\n")
+    write("\n")
+
+    out.write("".join(buf))
@@ -1,5 +1,6 @@
 """ Lexical analysis is the breaking of a string into tokens. """
 
+import bisect
 import re
 import linecache
 from builtins import SyntaxError as BaseSyntaxError
@@ -52,6 +53,10 @@ class FlatStringLexer:
         self.point = 0
         self.filename = filename
         self.closed = False
+        # Offsets in self.src of the lines starting after a '\n', found by
+        # scanning self.src up to self.line_starts_end.
+        self.line_starts = []
+        self.line_starts_end = 0
 
     def write(self, text):
         assert not self.closed
@@ -77,11 +82,10 @@ class FlatStringLexer:
             terminal_id = self._match(closing)
 
         # Update position info.
-        discarded_text = self.src[:self.point]
-        newline_count = self.src[:self.point].count('\n')
+        newline_count, line_start = self._line_containing(self.point)
         self.start_lineno += newline_count
         if newline_count > 0:
-            self.start_column = self.point - discarded_text.rindex('\n')
+            self.start_column = self.point - line_start + 1
         else:
             self.start_column += self.point
 
@@ -93,13 +97,33 @@ class FlatStringLexer:
         self.point = 0
         self.previous_token_end = 0
         self.current_token_start = 0
+        self.line_starts = []
+        self.line_starts_end = 0
+
+    def _line_containing(self, point):
+        """Return the number of '\n' characters in self.src[:point], and the
+        offset in self.src of the line containing `point`.
+
+        The offset is 0 if that line started before self.src. Line starts are
+        found once and kept in self.line_starts, so this costs a bisection
+        rather than copying and scanning all of self.src[:point].
+        """
+        starts = self.line_starts
+        if point > self.line_starts_end:
+            src = self.src
+            i = src.find('\n', self.line_starts_end, point)
+            while i != -1:
+                starts.append(i + 1)
+                i = src.find('\n', i + 1, point)
+            self.line_starts_end = point
+        n = bisect.bisect_right(starts, point)
+        return n, starts[n - 1] if n > 0 else 0
 
     def current_token_position(self):
-        src_pre = self.src[:self.current_token_start]
-        lineno = self.start_lineno + src_pre.count("\n")
-        if '\n' in src_pre:
-            line_start_index = src_pre.rfind("\n") + 1
-            column = self.current_token_start - line_start_index  # can be zero
+        newline_count, line_start = self._line_containing(self.current_token_start)
+        lineno = self.start_lineno + newline_count
+        if newline_count > 0:
+            column = self.current_token_start - line_start  # can be zero
         else:
             column = self.start_column + self.current_token_start
         return lineno, column
@@ -107,11 +131,8 @@ class FlatStringLexer:
     def current_line(self):
         # OK, this is gruesome, but we return the current line if we have the
         # whole thing and otherwise we ... try loading it from disk.
-        if '\n' in self.src[:self.current_token_start]:
-            line_start = self.src.rindex('\n', 0, self.current_token_start) + 1
-        elif self.start_column == 0:
-            line_start = 0
-        else:
+        newline_count, line_start = self._line_containing(self.current_token_start)
+        if newline_count == 0 and self.start_column != 0:
             line_start = -1
 
         if line_start != -1:
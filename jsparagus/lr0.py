@@ -14,7 +14,7 @@ import typing
 from .actions import (Accept, Action, CheckNotOnNewLine, FunCall, Lookahead,
                       OutputExpr, Unwind, Reduce, Seq)
 from .ordered import OrderedFrozenSet
-from .grammar import (CallMethod, Element, End, ErrorSymbol, Grammar,
+from .grammar import (CallMethod, End, ErrorSymbol,
                       LookaheadRule, NoLineTerminatorHere, Nt, ReduceExpr,
                       ReduceExprOrAccept, Some)
 from .rewrites import CanonicalGrammar, Prod
@@ -101,6 +101,12 @@ from . import types
 # The uncertainty in LR parsing means that code for an LR parser written by
 # hand, in the style of recursive descent, would read like gibberish. What we
 # can do instead is generate a parser table.
+#
+# A side effect of the superposition is that we never need to left-factor the
+# grammar, as an LL parser generator would. Productions which share a prefix,
+# like `stmt ::= FOR ( VAR IN ...` and `stmt ::= FOR ( VAR = ...`, have their
+# LR items in the same states until the point where they diverge, so the common
+# prefix is only analyzed and encoded once.
 
 
 @dataclass(frozen=True, order=True)
@@ -144,29 +150,6 @@ ShiftedTerm = typing.Union[str, Nt, ErrorSymbol]
 Term = typing.Union[ShiftedTerm, Action]
 
 
-def on_stack(grammar: Grammar, term: Element) -> bool:
-    """Returns whether an element of a production is consuming stack space or
-    not."""
-    if isinstance(term, Nt):
-        return True
-    elif grammar.is_terminal(term):
-        return True
-    elif isinstance(term, LookaheadRule):
-        return False
-    elif isinstance(term, ErrorSymbol):
-        return True
-    elif isinstance(term, End):
-        return True
-    elif term is NoLineTerminatorHere:
-        # No line terminator is a property of the next token being shifted. It
-        # is implemented as an action which once shifted past the next term,
-        # will check whether the previous term shifted is on a new line.
-        return False
-    elif isinstance(term, CallMethod):
-        return False
-    raise ValueError(term)
-
-
 def callmethods_to_funcalls(
         expr: ReduceExprOrAccept,
         pop: int,
@@ -264,13 +247,13 @@ class LR0Generator:
         # Visit the initial non-terminal, as well as all the non-terminals
         # which are at the left of each productions.
         todo: typing.Deque[Nt] = collections.deque()
-        visited_nts = []
+        visited_nts = set()
         todo.append(nt)
         while todo:
             nt = todo.popleft()
             if nt in visited_nts:
                 continue
-            visited_nts.append(nt)
+            visited_nts.add(nt)
             for prod_index, _ in grammar.prods_with_indexes_by_nt[nt]:
                 assert isinstance(prod_index, int)
                 lr_items.append(LRItem(
@@ -309,6 +292,49 @@ class LR0Generator:
     ) -> None:
         """Given one LRItem, register all the transitions and LR Items reachable
         through these transitions."""
+        # Items are visited depth-first, with an explicit stack of iterators
+        # over the items still to visit at each level rather than recursion.
+        todo: typing.List[typing.Iterator[LRItem]] = [iter([lr_item])]
+        while todo:
+            item = next(todo[-1], None)
+            if item is None:
+                todo.pop()
+                continue
+            term = self.item_transition_term(item)
+            if term is None:
+                # No edges after the reduce operation.
+                continue
+
+            # Add terminals, non-terminals and lookahead actions, as transitions to
+            # the next LR Item.
+            new_transition = term not in followed_by
+            followed_by[term].append(LRItem(
+                prod_index=item.prod_index,
+                offset=item.offset + 1,
+                lookahead=None,
+                followed_by=OrderedFrozenSet(),
+            ))
+
+            # If the term is a non-terminal, then add transitions from the
+            # beginning of all the productions which are matching this
+            # non-terminal.
+            #
+            # Only do it once per non-terminal to avoid infinite recursion on
+            # left-recursive grammars.
+            if isinstance(term, Nt) and new_transition:
+                todo.append(iter([
+                    LRItem(
+                        prod_index=prod_index,
+                        offset=0,
+                        lookahead=None,
+                        followed_by=OrderedFrozenSet(),
+                    )
+                    for prod_index, _ in self.grammar.prods_with_indexes_by_nt[term]
+                ]))
+
+    def item_transition_term(self, lr_item: LRItem) -> typing.Optional[Term]:
+        """Return the term on the edge leaving `lr_item`, or None if there is
+        no such edge."""
         prod = self.grammar.prods[lr_item.prod_index]
         assert isinstance(prod, Prod)
 
@@ -339,7 +365,7 @@ class LR0Generator:
                 term = CheckNotOnNewLine()
             elif isinstance(term, CallMethod):
                 funcalls: typing.List[Action] = []
-                pop = sum(1 for e in prod.rhs[:lr_item.offset] if on_stack(self.grammar.grammar, e))
+                pop = self.grammar.stack_depths[lr_item.prod_index][lr_item.offset]
                 callmethods_to_funcalls(term, pop, "expr", 0, funcalls)
                 term = Seq(funcalls)
 
@@ -347,7 +373,7 @@ class LR0Generator:
             # Add the reduce operation as a state transition in the generated
             # parse table. (TODO: this supposed that the canonical form did not
             # move the reduce action to be part of the production)
-            pop = sum(1 for e in prod.rhs if on_stack(self.grammar.grammar, e))
+            pop = self.grammar.stack_depths[lr_item.prod_index][-1]
             term = Reduce(Unwind(prod.nt, pop))
             expr = prod.reducer
             if expr is not None:
@@ -356,30 +382,5 @@ class LR0Generator:
                 term = Seq(funcalls + [term])
         else:
             # No edges after the reduce operation.
-            return
-
-        # Add terminals, non-terminals and lookahead actions, as transitions to
-        # the next LR Item.
-        new_transition = term not in followed_by
-        followed_by[term].append(LRItem(
-            prod_index=lr_item.prod_index,
-            offset=lr_item.offset + 1,
-            lookahead=None,
-            followed_by=OrderedFrozenSet(),
-        ))
-
-        # If the term is a non-terminal, then recursively add transitions from
-        # the beginning of all the productions which are matching this
-        # non-terminal.
-        #
-        # Only do it once per non-terminal to avoid infinite recursion on
-        # left-recursive grammars.
-        if isinstance(term, Nt) and new_transition:
-            for prod_index, _ in self.grammar.prods_with_indexes_by_nt[term]:
-                assert isinstance(prod_index, int)
-                self.item_transitions(LRItem(
-                    prod_index=prod_index,
-                    offset=0,
-                    lookahead=None,
-                    followed_by=OrderedFrozenSet(),
-                ), followed_by)
+            return None
+        return term
@@ -9,10 +9,8 @@ def state_43_actions(parser, lexer):
 
     value = None
     value = parser.stack[-1].value
-    replay = []
-    replay.append(StateTermValue(0, Nt(InitNt(goal=Nt('grammar'))), value, False))
-    del parser.stack[-1:]
-    parser.replay.extend(replay)
+    parser.stack.pop()
+    parser.replay.append(StateTermValue(0, nt_0, value, False))
     r0 = parser.replay.pop()
     state_84_actions(parser, lexer, r0)
     return
@@ -22,10 +20,8 @@ def state_44_actions(parser, lexer):
 
     value = None
     value = parser.methods.nt_defs_single(parser.stack[-1].value)
-    replay = []
-    replay.append(StateTermValue(0, Nt('nt_defs'), value, False))
-    del parser.stack[-1:]
-    parser.replay.extend(replay)
+    parser.stack.pop()
+    parser.replay.append(StateTermValue(0, nt_1, value, False))
     r0 = parser.replay.pop()
     state_82_actions(parser, lexer, r0)
     return
@@ -35,10 +31,8 @@ def state_45_actions(parser, lexer):
 
     value = None
     value = parser.methods.single(parser.stack[-1].value)
-    replay = []
-    replay.append(StateTermValue(0, Nt('token_defs'), value, False))
-    del parser.stack[-1:]
-    parser.replay.extend(replay)
+    parser.stack.pop()
+    parser.replay.append(StateTermValue(0, nt_2, value, False))
     r0 = parser.replay.pop()
     state_83_actions(parser, lexer, r0)
     return
@@ -48,10 +42,8 @@ def state_46_actions(parser, lexer):
 
     value = None
     value = parser.methods.nt_defs_append(parser.stack[-2].value, parser.stack[-1].value)
-    replay = []
-    replay.append(StateTermValue(0, Nt('nt_defs'), value, False))
     del parser.stack[-2:]
-    parser.replay.extend(replay)
+    parser.replay.append(StateTermValue(0, nt_1, value, False))
     r0 = parser.replay.pop()
     state_82_actions(parser, lexer, r0)
     return
@@ -61,10 +53,8 @@ def state_47_actions(parser, lexer):
 
     value = None
     value = parser.methods.append(parser.stack[-2].value, parser.stack[-1].value)
-    replay = []
-    replay.append(StateTermValue(0, Nt('token_defs'), value, False))
     del parser.stack[-2:]
-    parser.replay.extend(replay)
+    parser.replay.append(StateTermValue(0, nt_2, value, False))
     r0 = parser.replay.pop()
     state_83_actions(parser, lexer, r0)
     return
@@ -74,10 +64,8 @@ def state_48_actions(parser, lexer):
 
     value = None
     raise ShiftAccept()
-    replay = []
-    replay.append(StateTermValue(0, Nt(InitNt(goal=Nt('grammar'))), value, False))
     del parser.stack[-2:]
-    parser.replay.extend(replay)
+    parser.replay.append(StateTermValue(0, nt_0, value, False))
     r0 = parser.replay.pop()
     state_84_actions(parser, lexer, r0)
     return
@@ -87,10 +75,8 @@ def state_49_actions(parser, lexer):
 
     value = None
     value = parser.methods.nt_def(None, None, parser.stack[-3].value, None)
-    replay = []
-    replay.append(StateTermValue(0, Nt('nt_def'), value, False))
     del parser.stack[-4:]
-    parser.replay.extend(replay)
+    parser.replay.append(StateTermValue(0, nt_3, value, False))
     r0 = parser.replay.pop()
     state_107_actions(parser, lexer, r0)
     return
@@ -100,10 +86,8 @@ def state_50_actions(parser, lexer):
 
     value = None
     value = parser.methods.single(parser.stack[-1].value)
-    replay = []
-    replay.append(StateTermValue(0, Nt('prods'), value, False))
-    del parser.stack[-1:]
-    parser.replay.extend(replay)
+    parser.stack.pop()
+    parser.replay.append(StateTermValue(0, nt_4, value, False))
     r0 = parser.replay.pop()
     state_94_actions(parser, lexer, r0)
     return
@@ -113,10 +97,8 @@ def state_51_actions(parser, lexer):
 
     value = None
     value = parser.methods.single(parser.stack[-1].value)
-    replay = []
-    replay.append(StateTermValue(0, Nt('terms'), value, False))
-    del parser.stack[-1:]
-    parser.replay.extend(replay)
+    parser.stack.pop()
+    parser.replay.append(StateTermValue(0, nt_5, value, False))
     r0 = parser.replay.pop()
     state_97_actions(parser, lexer, r0)
     return
@@ -126,10 +108,8 @@ def state_52_actions(parser, lexer):
 
     value = None
     value = parser.methods.ident(parser.stack[-1].value)
-    replay = []
-    replay.append(StateTermValue(0, Nt('symbol'), value, False))
-    del parser.stack[-1:]
-    parser.replay.extend(replay)
+    parser.stack.pop()
+    parser.replay.append(StateTermValue(0, nt_6, value, False))
     r0 = parser.replay.pop()
     state_91_actions(parser, lexer, r0)
     return
@@ -139,10 +119,8 @@ def state_53_actions(parser, lexer):
 
     value = None
     value = parser.methods.str(parser.stack[-1].value)
-    replay = []
-    replay.append(StateTermValue(0, Nt('symbol'), value, False))
-    del parser.stack[-1:]
-    parser.replay.extend(replay)
+    parser.stack.pop()
+    parser.replay.append(StateTermValue(0, nt_6, value, False))
     r0 = parser.replay.pop()
     state_91_actions(parser, lexer, r0)
     return
@@ -152,10 +130,8 @@ def state_54_actions(parser, lexer):
 
     value = None
     value = parser.methods.empty(parser.stack[-1].value)
-    replay = []
-    replay.append(StateTermValue(0, Nt('prods'), value, False))
-    del parser.stack[-1:]
-    parser.replay.extend(replay)
+    parser.stack.pop()
+    parser.replay.append(StateTermValue(0, nt_4, value, False))
     r0 = parser.replay.pop()
     state_94_actions(parser, lexer, r0)
     return
@@ -165,10 +141,8 @@ def state_55_actions(parser, lexer):
 
     value = None
     value = parser.methods.var_token(parser.stack[-2].value)
-    replay = []
-    replay.append(StateTermValue(0, Nt('token_def'), value, False))
     del parser.stack[-4:]
-    parser.replay.extend(replay)
+    parser.replay.append(StateTermValue(0, nt_7, value, False))
     r0 = parser.replay.pop()
     state_100_actions(parser, lexer, r0)
     return
@@ -178,10 +152,8 @@ def state_56_actions(parser, lexer):
 
     value = None
     value = parser.methods.nt_def(None, None, parser.stack[-4].value, parser.stack[-2].value)
-    replay = []
-    replay.append(StateTermValue(0, Nt('nt_def'), value, False))
     del parser.stack[-5:]
-    parser.replay.extend(replay)
+    parser.replay.append(StateTermValue(0, nt_3, value, False))
     r0 = parser.replay.pop()
     state_107_actions(parser, lexer, r0)
     return
@@ -191,10 +163,8 @@ def state_57_actions(parser, lexer):
 
     value = None
     value = parser.methods.append(parser.stack[-2].value, parser.stack[-1].value)
-    replay = []
-    replay.append(StateTermValue(0, Nt('prods'), value, False))
     del parser.stack[-2:]
-    parser.replay.extend(replay)
+    parser.replay.append(StateTermValue(0, nt_4, value, False))
     r0 = parser.replay.pop()
     state_94_actions(parser, lexer, r0)
     return
@@ -204,10 +174,8 @@ def state_58_actions(parser, lexer):
 
     value = None
     value = parser.methods.prod(parser.stack[-2].value, None)
-    replay = []
-    replay.append(StateTermValue(0, Nt('prod'), value, False))
     del parser.stack[-2:]
-    parser.replay.extend(replay)
+    parser.replay.append(StateTermValue(0, nt_8, value, False))
     r0 = parser.replay.pop()
     state_101_actions(parser, lexer, r0)
     return
@@ -217,10 +185,8 @@ def state_59_actions(parser, lexer):
 
     value = None
     value = parser.methods.append(parser.stack[-2].value, parser.stack[-1].value)
-    replay = []
-    replay.append(StateTermValue(0, Nt('terms'), value, False))
     del parser.stack[-2:]
-    parser.replay.extend(replay)
+    parser.replay.append(StateTermValue(0, nt_5, value, False))
     r0 = parser.replay.pop()
     state_97_actions(parser, lexer, r0)
     return
@@ -230,10 +196,8 @@ def state_60_actions(parser, lexer):
 
     value = None
     value = parser.methods.optional(parser.stack[-2].value)
-    replay = []
-    replay.append(StateTermValue(0, Nt('term'), value, False))
     del parser.stack[-2:]
-    parser.replay.extend(replay)
+    parser.replay.append(StateTermValue(0, nt_9, value, False))
     r0 = parser.replay.pop()
     state_111_actions(parser, lexer, r0)
     return
@@ -243,10 +207,8 @@ def state_61_actions(parser, lexer):
 
     value = None
     value = parser.methods.nt_def(parser.stack[-5].value, None, parser.stack[-3].value, None)
-    replay = []
-    replay.append(StateTermValue(0, Nt('nt_def'), value, False))
     del parser.stack[-5:]
-    parser.replay.extend(replay)
+    parser.replay.append(StateTermValue(0, nt_3, value, False))
     r0 = parser.replay.pop()
     state_107_actions(parser, lexer, r0)
     return
@@ -256,10 +218,8 @@ def state_62_actions(parser, lexer):
 
     value = None
     value = parser.methods.nt_def(None, parser.stack[-5].value, parser.stack[-3].value, None)
-    replay = []
-    replay.append(StateTermValue(0, Nt('nt_def'), value, False))
     del parser.stack[-5:]
-    parser.replay.extend(replay)
+    parser.replay.append(StateTermValue(0, nt_3, value, False))
     r0 = parser.replay.pop()
     state_107_actions(parser, lexer, r0)
     return
@@ -269,10 +229,8 @@ def state_63_actions(parser, lexer):
 
     value = None
     value = parser.methods.const_token(parser.stack[-4].value, parser.stack[-2].value)
-    replay = []
-    replay.append(StateTermValue(0, Nt('token_def'), value, False))
     del parser.stack[-5:]
-    parser.replay.extend(replay)
+    parser.replay.append(StateTermValue(0, nt_7, value, False))
     r0 = parser.replay.pop()
     state_100_actions(parser, lexer, r0)
     return
@@ -282,10 +240,8 @@ def state_64_actions(parser, lexer):
 
     value = None
     value = parser.methods.prod(parser.stack[-3].value, parser.stack[-2].value)
-    replay = []
-    replay.append(StateTermValue(0, Nt('prod'), value, False))
     del parser.stack[-3:]
-    parser.replay.extend(replay)
+    parser.replay.append(StateTermValue(0, nt_8, value, False))
     r0 = parser.replay.pop()
     state_101_actions(parser, lexer, r0)
     return
@@ -295,10 +251,8 @@ def state_65_actions(parser, lexer):
 
     value = None
     value = parser.stack[-1].value
-    replay = []
-    replay.append(StateTermValue(0, Nt('reducer'), value, False))
     del parser.stack[-2:]
-    parser.replay.extend(replay)
+    parser.replay.append(StateTermValue(0, nt_10, value, False))
     r0 = parser.replay.pop()
     state_102_actions(parser, lexer, r0)
     return
@@ -308,10 +262,8 @@ def state_66_actions(parser, lexer):
 
     value = None
     value = parser.methods.expr_match(parser.stack[-1].value)
-    replay = []
-    replay.append(StateTermValue(0, Nt('expr'), value, False))
-    del parser.stack[-1:]
-    parser.replay.extend(replay)
+    parser.stack.pop()
+    parser.replay.append(StateTermValue(0, nt_11, value, False))
     r0 = parser.replay.pop()
     state_108_actions(parser, lexer, r0)
     return
@@ -321,10 +273,8 @@ def state_67_actions(parser, lexer):
 
     value = None
     value = parser.methods.expr_none()
-    replay = []
-    replay.append(StateTermValue(0, Nt('expr'), value, False))
-    del parser.stack[-1:]
-    parser.replay.extend(replay)
+    parser.stack.pop()
+    parser.replay.append(StateTermValue(0, nt_11, value, False))
     r0 = parser.replay.pop()
     state_108_actions(parser, lexer, r0)
     return
@@ -334,10 +284,8 @@ def state_68_actions(parser, lexer):
 
     value = None
     value = parser.methods.nt_def(parser.stack[-6].value, None, parser.stack[-4].value, parser.stack[-2].value)
-    replay = []
-    replay.append(StateTermValue(0, Nt('nt_def'), value, False))
     del parser.stack[-6:]
-    parser.replay.extend(replay)
+    parser.replay.append(StateTermValue(0, nt_3, value, False))
     r0 = parser.replay.pop()
     state_107_actions(parser, lexer, r0)
     return
@@ -347,10 +295,8 @@ def state_69_actions(parser, lexer):
 
     value = None
     value = parser.methods.nt_def(parser.stack[-6].value, parser.stack[-5].value, parser.stack[-3].value, None)
-    replay = []
-    replay.append(StateTermValue(0, Nt('nt_def'), value, False))
     del parser.stack[-6:]
-    parser.replay.extend(replay)
+    parser.replay.append(StateTermValue(0, nt_3, value, False))
     r0 = parser.replay.pop()
     state_107_actions(parser, lexer, r0)
     return
@@ -360,10 +306,8 @@ def state_70_actions(parser, lexer):
 
     value = None
     value = parser.methods.nt_def(None, parser.stack[-6].value, parser.stack[-4].value, parser.stack[-2].value)
-    replay = []
-    replay.append(StateTermValue(0, Nt('nt_def'), value, False))
     del parser.stack[-6:]
-    parser.replay.extend(replay)
+    parser.replay.append(StateTermValue(0, nt_3, value, False))
     r0 = parser.replay.pop()
     state_107_actions(parser, lexer, r0)
     return
@@ -373,10 +317,8 @@ def state_71_actions(parser, lexer):
 
     value = None
     value = parser.methods.nt_def(parser.stack[-7].value, parser.stack[-6].value, parser.stack[-4].value, parser.stack[-2].value)
-    replay = []
-    replay.append(StateTermValue(0, Nt('nt_def'), value, False))
     del parser.stack[-7:]
-    parser.replay.extend(replay)
+    parser.replay.append(StateTermValue(0, nt_3, value, False))
     r0 = parser.replay.pop()
     state_107_actions(parser, lexer, r0)
     return
@@ -386,10 +328,8 @@ def state_72_actions(parser, lexer):
 
     value = None
     value = parser.methods.expr_call(parser.stack[-3].value, None)
-    replay = []
-    replay.append(StateTermValue(0, Nt('expr'), value, False))
     del parser.stack[-3:]
-    parser.replay.extend(replay)
+    parser.replay.append(StateTermValue(0, nt_11, value, False))
     r0 = parser.replay.pop()
     state_108_actions(parser, lexer, r0)
     return
@@ -399,10 +339,8 @@ def state_73_actions(parser, lexer):
 
     value = None
     value = parser.methods.args_single(parser.stack[-1].value)
-    replay = []
-    replay.append(StateTermValue(0, Nt('expr_args'), value, False))
-    del parser.stack[-1:]
-    parser.replay.extend(replay)
+    parser.stack.pop()
+    parser.replay.append(StateTermValue(0, nt_12, value, False))
     r0 = parser.replay.pop()
     state_109_actions(parser, lexer, r0)
     return
@@ -412,10 +350,8 @@ def state_74_actions(parser, lexer):
 
     value = None
     value = parser.methods.expr_call(parser.stack[-4].value, parser.stack[-2].value)
-    replay = []
-    replay.append(StateTermValue(0, Nt('expr'), value, False))
     del parser.stack[-4:]
-    parser.replay.extend(replay)
+    parser.replay.append(StateTermValue(0, nt_11, value, False))
     r0 = parser.replay.pop()
     state_108_actions(parser, lexer, r0)
     return
@@ -425,10 +361,8 @@ def state_75_actions(parser, lexer):
 
     value = None
     value = parser.methods.expr_some(parser.stack[-2].value)
-    replay = []
-    replay.append(StateTermValue(0, Nt('expr'), value, False))
     del parser.stack[-4:]
-    parser.replay.extend(replay)
+    parser.replay.append(StateTermValue(0, nt_11, value, False))
     r0 = parser.replay.pop()
     state_108_actions(parser, lexer, r0)
     return
@@ -438,10 +372,8 @@ def state_76_actions(parser, lexer):
 
     value = None
     value = parser.methods.args_append(parser.stack[-3].value, parser.stack[-1].value)
-    replay = []
-    replay.append(StateTermValue(0, Nt('expr_args'), value, False))
     del parser.stack[-3:]
-    parser.replay.extend(replay)
+    parser.replay.append(StateTermValue(0, nt_12, value, False))
     r0 = parser.replay.pop()
     state_109_actions(parser, lexer, r0)
     return
@@ -451,11 +383,9 @@ def state_77_actions(parser, lexer):
 
     value = None
     value = parser.methods.grammar(None, parser.stack[-2].value)
-    replay = []
-    replay.append(parser.stack.pop())
-    replay.append(StateTermValue(0, Nt('grammar'), value, False))
-    del parser.stack[-1:]
-    parser.replay.extend(replay)
+    parser.replay.append(parser.stack.pop())
+    parser.stack.pop()
+    parser.replay.append(StateTermValue(0, nt_13, value, False))
     r0 = parser.replay.pop()
     state_110_actions(parser, lexer, r0)
     return
@@ -465,11 +395,9 @@ def state_78_actions(parser, lexer):
 
     value = None
     value = parser.methods.grammar(parser.stack[-3].value, parser.stack[-2].value)
-    replay = []
-    replay.append(parser.stack.pop())
-    replay.append(StateTermValue(0, Nt('grammar'), value, False))
+    parser.replay.append(parser.stack.pop())
     del parser.stack[-2:]
-    parser.replay.extend(replay)
+    parser.replay.append(StateTermValue(0, nt_13, value, False))
     r0 = parser.replay.pop()
     state_110_actions(parser, lexer, r0)
     return
@@ -479,11 +407,9 @@ def state_79_actions(parser, lexer):
 
     value = None
     value = parser.stack[-2].value
-    replay = []
-    replay.append(parser.stack.pop())
-    replay.append(StateTermValue(0, Nt('term'), value, False))
-    del parser.stack[-1:]
-    parser.replay.extend(replay)
+    parser.replay.append(parser.stack.pop())
+    parser.stack.pop()
+    parser.replay.append(StateTermValue(0, nt_9, value, False))
     r0 = parser.replay.pop()
     state_111_actions(parser, lexer, r0)
     return
@@ -494,9 +420,8 @@ def state_80_actions(parser, lexer, a0):
 
     value = None
     parser.replay_action(12)
-    top = parser.stack.pop()
-    top = StateTermValue(12, top.term, top.value, top.new_line)
-    parser.stack.append(top)
+    top = parser.stack[-1]
+    parser.stack[-1] = StateTermValue(12, top.term, top.value, top.new_line)
     return
 
 def state_81_actions(parser, lexer, a0):
@@ -505,23 +430,21 @@ def state_81_actions(parser, lexer, a0):
 
     value = None
     parser.replay_action(13)
-    top = parser.stack.pop()
-    top = StateTermValue(13, top.term, top.value, top.new_line)
-    parser.stack.append(top)
+    top = parser.stack[-1]
+    parser.stack[-1] = StateTermValue(13, top.term, top.value, top.new_line)
     return
 
 def state_82_actions(parser, lexer, a0):
     parser.replay.extend([a0])
 
     value = None
-    if parser.top_state() in [10]:
-        r0 = parser.replay.pop()
-        state_80_actions(parser, lexer, r0)
-        return
-    if parser.top_state() in [11]:
-        r0 = parser.replay.pop()
-        state_81_actions(parser, lexer, r0)
+    try:
+        dest = state_82_dispatch[parser.top_state()]
+    except KeyError:
         return
+    r0 = parser.replay.pop()
+    actions[dest](parser, lexer, r0)
+    return
 
 def state_83_actions(parser, lexer, a0):
     parser.replay.extend([a0])
@@ -529,9 +452,8 @@ def state_83_actions(parser, lexer, a0):
 
     value = None
     parser.replay_action(11)
-    top = parser.stack.pop()
-    top = StateTermValue(11, top.term, top.value, top.new_line)
-    parser.stack.append(top)
+    top = parser.stack[-1]
+    parser.stack[-1] = StateTermValue(11, top.term, top.value, top.new_line)
     return
 
 def state_84_actions(parser, lexer, a0):
@@ -540,9 +462,8 @@ def state_84_actions(parser, lexer, a0):
 
     value = None
     parser.replay_action(23)
-    top = parser.stack.pop()
-    top = StateTermValue(23, top.term, top.value, top.new_line)
-    parser.stack.append(top)
+    top = parser.stack[-1]
+    parser.stack[-1] = StateTermValue(23, top.term, top.value, top.new_line)
     return
 
 def state_85_actions(parser, lexer, a0):
@@ -552,10 +473,8 @@ def state_85_actions(parser, lexer, a0):
 
     value = None
     value = parser.methods.nt_defs_single(parser.stack[-1].value)
-    replay = []
-    replay.append(StateTermValue(0, Nt('nt_defs'), value, False))
-    del parser.stack[-1:]
-    parser.replay.extend(replay)
+    parser.stack.pop()
+    parser.replay.append(StateTermValue(0, nt_1, value, False))
     r0 = parser.replay.pop()
     state_82_actions(parser, lexer, r0)
     return
@@ -567,10 +486,8 @@ def state_86_actions(parser, lexer, a0):
 
     value = None
     value = parser.methods.nt_defs_append(parser.stack[-2].value, parser.stack[-1].value)
-    replay = []
-    replay.append(StateTermValue(0, Nt('nt_defs'), value, False))
     del parser.stack[-2:]
-    parser.replay.extend(replay)
+    parser.replay.append(StateTermValue(0, nt_1, value, False))
     r0 = parser.replay.pop()
     state_82_actions(parser, lexer, r0)
     return
@@ -581,9 +498,8 @@ def state_87_actions(parser, lexer, a0):
 
     value = None
     parser.replay_action(4)
-    top = parser.stack.pop()
-    top = StateTermValue(4, top.term, top.value, top.new_line)
-    parser.stack.append(top)
+    top = parser.stack[-1]
+    parser.stack[-1] = StateTermValue(4, top.term, top.value, top.new_line)
     return
 
 def state_88_actions(parser, lexer, a0):
@@ -592,9 +508,8 @@ def state_88_actions(parser, lexer, a0):
 
     value = None
     parser.replay_action(5)
-    top = parser.stack.pop()
-    top = StateTermValue(5, top.term, top.value, top.new_line)
-    parser.stack.append(top)
+    top = parser.stack[-1]
+    parser.stack[-1] = StateTermValue(5, top.term, top.value, top.new_line)
     return
 
 def state_89_actions(parser, lexer, a0):
@@ -603,9 +518,8 @@ def state_89_actions(parser, lexer, a0):
 
     value = None
     parser.replay_action(6)
-    top = parser.stack.pop()
-    top = StateTermValue(6, top.term, top.value, top.new_line)
-    parser.stack.append(top)
+    top = parser.stack[-1]
+    parser.stack[-1] = StateTermValue(6, top.term, top.value, top.new_line)
     return
 
 def state_90_actions(parser, lexer, a0):
@@ -614,9 +528,8 @@ def state_90_actions(parser, lexer, a0):
 
     value = None
     parser.replay_action(7)
-    top = parser.stack.pop()
-    top = StateTermValue(7, top.term, top.value, top.new_line)
-    parser.stack.append(top)
+    top = parser.stack[-1]
+    parser.stack[-1] = StateTermValue(7, top.term, top.value, top.new_line)
     return
 
 def state_91_actions(parser, lexer, a0):
@@ -625,9 +538,8 @@ def state_91_actions(parser, lexer, a0):
 
     value = None
     parser.replay_action(9)
-    top = parser.stack.pop()
-    top = StateTermValue(9, top.term, top.value, top.new_line)
-    parser.stack.append(top)
+    top = parser.stack[-1]
+    parser.stack[-1] = StateTermValue(9, top.term, top.value, top.new_line)
     return
 
 def state_92_actions(parser, lexer, a0):
@@ -637,10 +549,8 @@ def state_92_actions(parser, lexer, a0):
 
     value = None
     value = parser.methods.single(parser.stack[-1].value)
-    replay = []
-    replay.append(StateTermValue(0, Nt('token_defs'), value, False))
-    del parser.stack[-1:]
-    parser.replay.extend(replay)
+    parser.stack.pop()
+    parser.replay.append(StateTermValue(0, nt_2, value, False))
     r0 = parser.replay.pop()
     state_83_actions(parser, lexer, r0)
     return
@@ -652,10 +562,8 @@ def state_93_actions(parser, lexer, a0):
 
     value = None
     value = parser.methods.append(parser.stack[-2].value, parser.stack[-1].value)
-    replay = []
-    replay.append(StateTermValue(0, Nt('token_defs'), value, False))
     del parser.stack[-2:]
-    parser.replay.extend(replay)
+    parser.replay.append(StateTermValue(0, nt_2, value, False))
     r0 = parser.replay.pop()
     state_83_actions(parser, lexer, r0)
     return
@@ -664,22 +572,13 @@ def state_94_actions(parser, lexer, a0):
     parser.replay.extend([a0])
 
     value = None
-    if parser.top_state() in [0]:
-        r0 = parser.replay.pop()
-        state_87_actions(parser, lexer, r0)
-        return
-    if parser.top_state() in [1]:
-        r0 = parser.replay.pop()
-        state_88_actions(parser, lexer, r0)
-        return
-    if parser.top_state() in [2]:
-        r0 = parser.replay.pop()
-        state_89_actions(parser, lexer, r0)
-        return
-    if parser.top_state() in [3]:
-        r0 = parser.replay.pop()
-        state_90_actions(parser, lexer, r0)
+    try:
+        dest = state_94_dispatch[parser.top_state()]
+    except KeyError:
         return
+    r0 = parser.replay.pop()
+    actions[dest](parser, lexer, r0)
+    return
 
 def state_95_actions(parser, lexer, a0):
     parser.replay.extend([a0])
@@ -688,10 +587,8 @@ def state_95_actions(parser, lexer, a0):
 
     value = None
     value = parser.methods.single(parser.stack[-1].value)
-    replay = []
-    replay.append(StateTermValue(0, Nt('prods'), value, False))
-    del parser.stack[-1:]
-    parser.replay.extend(replay)
+    parser.stack.pop()
+    parser.replay.append(StateTermValue(0, nt_4, value, False))
     r0 = parser.replay.pop()
     state_94_actions(parser, lexer, r0)
     return
@@ -703,10 +600,8 @@ def state_96_actions(parser, lexer, a0):
 
     value = None
     value = parser.methods.append(parser.stack[-2].value, parser.stack[-1].value)
-    replay = []
-    replay.append(StateTermValue(0, Nt('prods'), value, False))
     del parser.stack[-2:]
-    parser.replay.extend(replay)
+    parser.replay.append(StateTermValue(0, nt_4, value, False))
     r0 = parser.replay.pop()
     state_94_actions(parser, lexer, r0)
     return
@@ -717,9 +612,8 @@ def state_97_actions(parser, lexer, a0):
 
     value = None
     parser.replay_action(8)
-    top = parser.stack.pop()
-    top = StateTermValue(8, top.term, top.value, top.new_line)
-    parser.stack.append(top)
+    top = parser.stack[-1]
+    parser.stack[-1] = StateTermValue(8, top.term, top.value, top.new_line)
     return
 
 def state_98_actions(parser, lexer, a0):
@@ -729,10 +623,8 @@ def state_98_actions(parser, lexer, a0):
 
     value = None
     value = parser.methods.single(parser.stack[-1].value)
-    replay = []
-    replay.append(StateTermValue(0, Nt('terms'), value, False))
-    del parser.stack[-1:]
-    parser.replay.extend(replay)
+    parser.stack.pop()
+    parser.replay.append(StateTermValue(0, nt_5, value, False))
     r0 = parser.replay.pop()
     state_97_actions(parser, lexer, r0)
     return
@@ -744,10 +636,8 @@ def state_99_actions(parser, lexer, a0):
 
     value = None
     value = parser.methods.append(parser.stack[-2].value, parser.stack[-1].value)
-    replay = []
-    replay.append(StateTermValue(0, Nt('terms'), value, False))
     del parser.stack[-2:]
-    parser.replay.extend(replay)
+    parser.replay.append(StateTermValue(0, nt_5, value, False))
     r0 = parser.replay.pop()
     state_97_actions(parser, lexer, r0)
     return
@@ -756,27 +646,25 @@ def state_100_actions(parser, lexer, a0):
     parser.replay.extend([a0])
 
     value = None
-    if parser.top_state() in [10]:
-        r0 = parser.replay.pop()
-        state_92_actions(parser, lexer, r0)
-        return
-    if parser.top_state() in [11]:
-        r0 = parser.replay.pop()
-        state_93_actions(parser, lexer, r0)
+    try:
+        dest = state_100_dispatch[parser.top_state()]
+    except KeyError:
         return
+    r0 = parser.replay.pop()
+    actions[dest](parser, lexer, r0)
+    return
 
 def state_101_actions(parser, lexer, a0):
     parser.replay.extend([a0])
 
     value = None
-    if parser.top_state() in [0, 1, 2, 3]:
-        r0 = parser.replay.pop()
-        state_95_actions(parser, lexer, r0)
-        return
-    if parser.top_state() in [4, 5, 6, 7]:
-        r0 = parser.replay.pop()
-        state_96_actions(parser, lexer, r0)
+    try:
+        dest = state_101_dispatch[parser.top_state()]
+    except KeyError:
         return
+    r0 = parser.replay.pop()
+    actions[dest](parser, lexer, r0)
+    return
 
 def state_102_actions(parser, lexer, a0):
     parser.replay.extend([a0])
@@ -784,9 +672,8 @@ def state_102_actions(parser, lexer, a0):
 
     value = None
     parser.replay_action(38)
-    top = parser.stack.pop()
-    top = StateTermValue(38, top.term, top.value, top.new_line)
-    parser.stack.append(top)
+    top = parser.stack[-1]
+    parser.stack[-1] = StateTermValue(38, top.term, top.value, top.new_line)
     return
 
 def state_103_actions(parser, lexer, a0):
@@ -796,10 +683,8 @@ def state_103_actions(parser, lexer, a0):
 
     value = None
     value = parser.stack[-1].value
-    replay = []
-    replay.append(StateTermValue(0, Nt('reducer'), value, False))
     del parser.stack[-2:]
-    parser.replay.extend(replay)
+    parser.replay.append(StateTermValue(0, nt_10, value, False))
     r0 = parser.replay.pop()
     state_102_actions(parser, lexer, r0)
     return
@@ -811,10 +696,8 @@ def state_104_actions(parser, lexer, a0):
 
     value = None
     value = parser.methods.args_single(parser.stack[-1].value)
-    replay = []
-    replay.append(StateTermValue(0, Nt('expr_args'), value, False))
-    del parser.stack[-1:]
-    parser.replay.extend(replay)
+    parser.stack.pop()
+    parser.replay.append(StateTermValue(0, nt_12, value, False))
     r0 = parser.replay.pop()
     state_109_actions(parser, lexer, r0)
     return
@@ -825,9 +708,8 @@ def state_105_actions(parser, lexer, a0):
 
     value = None
     parser.replay_action(42)
-    top = parser.stack.pop()
-    top = StateTermValue(42, top.term, top.value, top.new_line)
-    parser.stack.append(top)
+    top = parser.stack[-1]
+    parser.stack[-1] = StateTermValue(42, top.term, top.value, top.new_line)
     return
 
 def state_106_actions(parser, lexer, a0):
@@ -837,10 +719,8 @@ def state_106_actions(parser, lexer, a0):
 
     value = None
     value = parser.methods.args_append(parser.stack[-3].value, parser.stack[-1].value)
-    replay = []
-    replay.append(StateTermValue(0, Nt('expr_args'), value, False))
     del parser.stack[-3:]
-    parser.replay.extend(replay)
+    parser.replay.append(StateTermValue(0, nt_12, value, False))
     r0 = parser.replay.pop()
     state_109_actions(parser, lexer, r0)
     return
@@ -849,35 +729,25 @@ def state_107_actions(parser, lexer, a0):
     parser.replay.extend([a0])
 
     value = None
-    if parser.top_state() in [10, 11]:
-        r0 = parser.replay.pop()
-        state_85_actions(parser, lexer, r0)
-        return
-    if parser.top_state() in [12, 13]:
-        r0 = parser.replay.pop()
-        state_86_actions(parser, lexer, r0)
+    try:
+        dest = state_107_dispatch[parser.top_state()]
+    except KeyError:
         return
+    r0 = parser.replay.pop()
+    actions[dest](parser, lexer, r0)
+    return
 
 def state_108_actions(parser, lexer, a0):
     parser.replay.extend([a0])
 
     value = None
-    if parser.top_state() in [15]:
-        r0 = parser.replay.pop()
-        state_103_actions(parser, lexer, r0)
-        return
-    if parser.top_state() in [14]:
-        r0 = parser.replay.pop()
-        state_104_actions(parser, lexer, r0)
-        return
-    if parser.top_state() in [16]:
-        r0 = parser.replay.pop()
-        state_105_actions(parser, lexer, r0)
-        return
-    if parser.top_state() in [17]:
-        r0 = parser.replay.pop()
-        state_106_actions(parser, lexer, r0)
+    try:
+        dest = state_108_dispatch[parser.top_state()]
+    except KeyError:
         return
+    r0 = parser.replay.pop()
+    actions[dest](parser, lexer, r0)
+    return
 
 def state_109_actions(parser, lexer, a0):
     parser.replay.extend([a0])
@@ -885,9 +755,8 @@ def state_109_actions(parser, lexer, a0):
 
     value = None
     parser.replay_action(41)
-    top = parser.stack.pop()
-    top = StateTermValue(41, top.term, top.value, top.new_line)
-    parser.stack.append(top)
+    top = parser.stack[-1]
+    parser.stack[-1] = StateTermValue(41, top.term, top.value, top.new_line)
     return
 
 def state_110_actions(parser, lexer, a0):
@@ -897,10 +766,8 @@ def state_110_actions(parser, lexer, a0):
 
     value = None
     value = parser.stack[-1].value
-    replay = []
-    replay.append(StateTermValue(0, Nt(InitNt(goal=Nt('grammar'))), value, False))
-    del parser.stack[-1:]
-    parser.replay.extend(replay)
+    parser.stack.pop()
+    parser.replay.append(StateTermValue(0, nt_0, value, False))
     r0 = parser.replay.pop()
     state_84_actions(parser, lexer, r0)
     return
@@ -909,87 +776,115 @@ def state_111_actions(parser, lexer, a0):
     parser.replay.extend([a0])
 
     value = None
-    if parser.top_state() in [0, 1, 2, 3, 4, 5, 6, 7]:
-        r0 = parser.replay.pop()
-        state_98_actions(parser, lexer, r0)
-        return
-    if parser.top_state() in [8]:
-        r0 = parser.replay.pop()
-        state_99_actions(parser, lexer, r0)
+    try:
+        dest = state_111_dispatch[parser.top_state()]
+    except KeyError:
         return
+    r0 = parser.replay.pop()
+    actions[dest](parser, lexer, r0)
+    return
+
+nt_0 = Nt(InitNt(goal=Nt('grammar')))
+nt_1 = Nt('nt_defs')
+nt_2 = Nt('token_defs')
+nt_3 = Nt('nt_def')
+nt_4 = Nt('prods')
+nt_5 = Nt('terms')
+nt_6 = Nt('symbol')
+nt_7 = Nt('token_def')
+nt_8 = Nt('prod')
+nt_9 = Nt('term')
+nt_10 = Nt('reducer')
+nt_11 = Nt('expr')
+nt_12 = Nt('expr_args')
+nt_13 = Nt('grammar')
+
+state_82_dispatch = {10: 80, 11: 81}
+
+state_94_dispatch = {0: 87, 1: 88, 2: 89, 3: 90}
+
+state_100_dispatch = {10: 92, 11: 93}
+
+state_101_dispatch = {0: 95, 1: 95, 2: 95, 3: 95, 4: 96, 5: 96, 6: 96, 7: 96}
+
+state_107_dispatch = {10: 85, 11: 85, 12: 86, 13: 86}
+
+state_108_dispatch = {15: 103, 14: 104, 16: 105, 17: 106}
+
+state_111_dispatch = {0: 98, 1: 98, 2: 98, 3: 98, 4: 98, 5: 98, 6: 98, 7: 98, 8: 99}
 
 actions = [
     # 0.
 
-    {'}': 49, 'IDENT': 52, 'STR': 53, 'COMMENT': 54, Nt('prods'): 4, Nt('prod'): 50, Nt('terms'): 8, Nt('term'): 51, Nt('symbol'): 9},
+    {'}': 49, 'IDENT': 52, 'STR': 53, 'COMMENT': 54, nt_4: 4, nt_8: 50, nt_5: 8, nt_9: 51, nt_6: 9},
 
     # 1.
 
-    {'}': 61, 'IDENT': 52, 'STR': 53, 'COMMENT': 54, Nt('prods'): 5, Nt('prod'): 50, Nt('terms'): 8, Nt('term'): 51, Nt('symbol'): 9},
+    {'}': 61, 'IDENT': 52, 'STR': 53, 'COMMENT': 54, nt_4: 5, nt_8: 50, nt_5: 8, nt_9: 51, nt_6: 9},
 
     # 2.
 
-    {'}': 62, 'IDENT': 52, 'STR': 53, 'COMMENT': 54, Nt('prods'): 6, Nt('prod'): 50, Nt('terms'): 8, Nt('term'): 51, Nt('symbol'): 9},
+    {'}': 62, 'IDENT': 52, 'STR': 53, 'COMMENT': 54, nt_4: 6, nt_8: 50, nt_5: 8, nt_9: 51, nt_6: 9},
 
     # 3.
 
-    {'}': 69, 'IDENT': 52, 'STR': 53, 'COMMENT': 54, Nt('prods'): 7, Nt('prod'): 50, Nt('terms'): 8, Nt('term'): 51, Nt('symbol'): 9},
+    {'}': 69, 'IDENT': 52, 'STR': 53, 'COMMENT': 54, nt_4: 7, nt_8: 50, nt_5: 8, nt_9: 51, nt_6: 9},
 
     # 4.
 
-    {'}': 56, 'IDENT': 52, 'STR': 53, Nt('prod'): 57, Nt('terms'): 8, Nt('term'): 51, Nt('symbol'): 9},
+    {'}': 56, 'IDENT': 52, 'STR': 53, nt_8: 57, nt_5: 8, nt_9: 51, nt_6: 9},
 
     # 5.
 
-    {'}': 68, 'IDENT': 52, 'STR': 53, Nt('prod'): 57, Nt('terms'): 8, Nt('term'): 51, Nt('symbol'): 9},
+    {'}': 68, 'IDENT': 52, 'STR': 53, nt_8: 57, nt_5: 8, nt_9: 51, nt_6: 9},
 
     # 6.
 
-    {'}': 70, 'IDENT': 52, 'STR': 53, Nt('prod'): 57, Nt('terms'): 8, Nt('term'): 51, Nt('symbol'): 9},
+    {'}': 70, 'IDENT': 52, 'STR': 53, nt_8: 57, nt_5: 8, nt_9: 51, nt_6: 9},
 
     # 7.
 
-    {'}': 71, 'IDENT': 52, 'STR': 53, Nt('prod'): 57, Nt('terms'): 8, Nt('term'): 51, Nt('symbol'): 9},
+    {'}': 71, 'IDENT': 52, 'STR': 53, nt_8: 57, nt_5: 8, nt_9: 51, nt_6: 9},
 
     # 8.
 
-    {';': 58, 'IDENT': 52, 'STR': 53, '=>': 15, Nt('term'): 59, Nt('symbol'): 9, Nt('reducer'): 38},
+    {';': 58, 'IDENT': 52, 'STR': 53, '=>': 15, nt_9: 59, nt_6: 9, nt_10: 38},
 
     # 9.
 
-    {'=>': 79, 'STR': 79, 'IDENT': 79, ';': 79, '?': 60, Nt('reducer'): 79, Nt('symbol'): 79, Nt('term'): 79},
+    {'=>': 79, 'STR': 79, 'IDENT': 79, ';': 79, '?': 60, nt_10: 79, nt_6: 79, nt_9: 79},
 
     # 10.
 
-    {'nt': 18, 'COMMENT': 19, 'goal': 20, 'token': 21, 'var': 22, Nt('grammar'): 43, Nt('nt_defs'): 12, Nt('nt_def'): 44, Nt('token_defs'): 11, Nt('token_def'): 45, Nt(InitNt(goal=Nt('grammar'))): 23},
+    {'nt': 18, 'COMMENT': 19, 'goal': 20, 'token': 21, 'var': 22, nt_13: 43, nt_1: 12, nt_3: 44, nt_2: 11, nt_7: 45, nt_0: 23},
 
     # 11.
 
-    {'nt': 18, 'COMMENT': 19, 'goal': 20, 'token': 21, 'var': 22, Nt('nt_defs'): 13, Nt('nt_def'): 44, Nt('token_def'): 47},
+    {'nt': 18, 'COMMENT': 19, 'goal': 20, 'token': 21, 'var': 22, nt_1: 13, nt_3: 44, nt_7: 47},
 
     # 12.
 
-    {End(): 77, 'goal': 20, 'COMMENT': 19, 'nt': 18, Nt('nt_def'): 46},
+    {End(): 77, 'goal': 20, 'COMMENT': 19, 'nt': 18, nt_3: 46},
 
     # 13.
 
-    {End(): 78, 'goal': 20, 'COMMENT': 19, 'nt': 18, Nt('nt_def'): 46},
+    {End(): 78, 'goal': 20, 'COMMENT': 19, 'nt': 18, nt_3: 46},
 
     # 14.
 
-    {')': 72, 'MATCH': 66, 'IDENT': 39, 'Some': 40, 'None': 67, Nt('expr_args'): 41, Nt('expr'): 73},
+    {')': 72, 'MATCH': 66, 'IDENT': 39, 'Some': 40, 'None': 67, nt_12: 41, nt_11: 73},
 
     # 15.
 
-    {'MATCH': 66, 'IDENT': 39, 'Some': 40, 'None': 67, Nt('expr'): 65},
+    {'MATCH': 66, 'IDENT': 39, 'Some': 40, 'None': 67, nt_11: 65},
 
     # 16.
 
-    {'MATCH': 66, 'IDENT': 39, 'Some': 40, 'None': 67, Nt('expr'): 42},
+    {'MATCH': 66, 'IDENT': 39, 'Some': 40, 'None': 67, nt_11: 42},
 
     # 17.
 
-    {'MATCH': 66, 'IDENT': 39, 'Some': 40, 'None': 67, Nt('expr'): 76},
+    {'MATCH': 66, 'IDENT': 39, 'Some': 40, 'None': 67, nt_11: 76},
 
     # 18.
 
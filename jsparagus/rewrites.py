@@ -15,21 +15,11 @@ from .grammar import (CallMethod, Element, End, ErrorSymbol, Exclude, Grammar,
                       Var, is_concrete_element)
 from .ordered import OrderedFrozenSet, OrderedSet
 from .runtime import ErrorToken, ErrorTokenClass
+from .utils import strongly_connected_components
 
 
 # *** Checking for errors *****************************************************
 
-T = typing.TypeVar("T")
-
-
-def fix(f: typing.Callable[[T], T], start: T) -> T:
-    """Compute a fixed point of `f`, the hard way, starting from `start`."""
-    prev, current = start, f(start)
-    while current != prev:
-        prev, current = current, f(current)
-    return current
-
-
 def empty_nt_set(grammar: Grammar) -> typing.Dict[LenientNt, ReduceExprOrAccept]:
     """Determine which nonterminals in `grammar` can produce the empty string.
 
@@ -179,17 +169,17 @@ def check_cycle_free(grammar: Grammar) -> None:
                     # nt can definitely produce all the nonterminals in result.
                     direct_produces[orig] |= set(result)
 
-    def step(
-            produces: typing.Dict[LenientNt, typing.Set[Nt]]
-    ) -> typing.Dict[LenientNt, typing.Set[Nt]]:
-        return {
-            orig: dest | set(b for a in dest for b in produces[a])
-            for orig, dest in produces.items()
-        }
-    produces = fix(step, direct_produces)
+    # A nonterminal produces itself if it is part of a cycle in the
+    # direct_produces graph: either its strongly connected component has
+    # several members, or it directly produces itself.
+    cyclic: typing.Set[LenientNt] = set()
+    for component in strongly_connected_components(direct_produces):
+        first = component[0]
+        if len(component) > 1 or first in direct_produces.get(first, ()):
+            cyclic.update(component)
 
     for nt in grammar.nonterminals:
-        if nt in produces[nt]:
+        if nt in cyclic:
             raise ValueError(
                 "invalid grammar: nonterminal {} can produce itself"
                 .format(nt))
@@ -337,7 +327,9 @@ EMPTY = "(empty)"
 END = None
 
 TerminalOrEmpty = str
-TerminalOrEmptyOrErrorToken = typing.Union[str, ErrorTokenClass]
+# END shows up in start sets only for productions that contain an End element,
+# that is, the productions of init nonterminals.
+TerminalOrEmptyOrErrorToken = typing.Union[str, ErrorTokenClass, None]
 StartSets = typing.Dict[Nt, OrderedFrozenSet[TerminalOrEmptyOrErrorToken]]
 
 
@@ -401,6 +393,8 @@ def seq_start(
             s.add(ErrorToken)
         elif isinstance(e, Nt):
             s |= start[e]
+        elif isinstance(e, End):
+            s.add(END)
         elif e is NoLineTerminatorHere:
             s.add(EMPTY)
         else:
@@ -447,6 +441,8 @@ def make_start_set_cache(
                 s = start[e]
                 if EMPTY in s:
                     s = OrderedFrozenSet((s - {EMPTY}) | sets[-1])
+            elif isinstance(e, End):
+                s = OrderedFrozenSet([END])
             elif e is NoLineTerminatorHere:
                 s = sets[-1]
             else:
@@ -608,15 +604,18 @@ def expand_optional_symbols_in_rhs(
         yield rhs[start_index:], {}
         return
 
+    # The prefix up to rhs[i] is the same for every expansion of the rest of
+    # the production: slice it once, not twice per expansion.
+    without = rhs[start_index:i]
+    e = rhs[i]
+    with_inner = without + [e.inner if isinstance(e, Optional) else e]
     for expanded, r in expand_optional_symbols_in_rhs(rhs, grammar, empties, i + 1):
-        e = rhs[i]
-        rhs_inner = e.inner if isinstance(e, Optional) else e
         # without rhs[i]
         r2 = r.copy()
         r2[i] = replacement
-        yield rhs[start_index:i] + expanded, r2
+        yield without + expanded, r2
         # with rhs[i]
-        yield rhs[start_index:i] + [rhs_inner] + expanded, r
+        yield with_inner + expanded, r
 
 
 def expand_all_optional_elements(grammar: Grammar) -> typing.Tuple[
@@ -712,8 +711,31 @@ def expand_all_optional_elements(grammar: Grammar) -> typing.Tuple[
             prods_with_indexes_by_nt)
 
 
+def on_stack(grammar: Grammar, term: Element) -> bool:
+    """Returns whether an element of a production is consuming stack space or
+    not."""
+    if isinstance(term, Nt):
+        return True
+    elif grammar.is_terminal(term):
+        return True
+    elif isinstance(term, LookaheadRule):
+        return False
+    elif isinstance(term, ErrorSymbol):
+        return True
+    elif isinstance(term, End):
+        return True
+    elif term is NoLineTerminatorHere:
+        # No line terminator is a property of the next token being shifted. It
+        # is implemented as an action which once shifted past the next term,
+        # will check whether the previous term shifted is on a new line.
+        return False
+    elif isinstance(term, CallMethod):
+        return False
+    raise ValueError(term)
+
+
 class CanonicalGrammar:
-    __slots__ = ["prods", "prods_with_indexes_by_nt", "grammar"]
+    __slots__ = ["prods", "prods_with_indexes_by_nt", "grammar", "stack_depths"]
 
     prods: typing.List[Prod]
     prods_with_indexes_by_nt: typing.Mapping[
@@ -721,6 +743,10 @@ class CanonicalGrammar:
         typing.List[typing.Tuple[int, typing.List[Element]]]]
     grammar: Grammar
 
+    # `stack_depths[prod_index][offset]` is the number of elements of
+    # `prods[prod_index].rhs[:offset]` which are on the parser stack.
+    stack_depths: typing.List[typing.List[int]]
+
     def __init__(self, grammar: Grammar) -> None:
         # Step by step, we check the grammar and lower it to a more primitive form.
         grammar = expand_parameterized_nonterminals(grammar)
@@ -733,3 +759,10 @@ class CanonicalGrammar:
         self.prods = prods
         self.prods_with_indexes_by_nt = prods_with_indexes_by_nt
         self.grammar = grammar
+
+        self.stack_depths = []
+        for prod in prods:
+            depths = [0]
+            for e in prod.rhs:
+                depths.append(depths[-1] + int(on_stack(grammar, e)))
+            self.stack_depths.append(depths)
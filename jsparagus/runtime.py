@@ -137,40 +137,47 @@ class Parser:
         ))
 
     def _shift(self, stv, lexer):
-        state = self.stack[-1].state
-        if self.debug:
+        # This loop runs for every token and every reduction, so the attributes
+        # it uses are read into locals once. (Actions mutate parser.stack and
+        # parser.replay in place, so the local names stay valid.)
+        stack = self.stack
+        replay = self.replay
+        actions = self.actions
+        debug = self.debug
+        state = stack[-1].state
+        if debug:
             self._dbg_where("shift: {}".format(str(stv.term)))
-        if not isinstance(self.actions[state], dict):
+        if not isinstance(actions[state], dict):
             # This happens after raising a ShiftAccept error.
             if stv.term == End():
                 raise ShiftAccept()
             raise ShiftError()
         self.last_shift = (state, stv)
         while True:
-            goto = self.actions[state].get(stv.term, ERROR)
+            goto = actions[state].get(stv.term, ERROR)
             if goto == ERROR:
-                if self.debug:
+                if debug:
                     self._dbg_where("(error)")
                 self._try_error_handling(lexer, stv)
-                stv = self.replay.pop()
-                if self.debug:
+                stv = replay.pop()
+                if debug:
                     self._dbg_where("error: {}".format(str(stv.term)))
                 continue
             state = goto
-            self.stack.append(StateTermValue(state, stv.term, stv.value, stv.new_line))
-            action = self.actions[state]
+            stack.append(StateTermValue(state, stv.term, stv.value, stv.new_line))
+            action = actions[state]
             if not isinstance(action, dict):  # Action
-                if self.debug:
+                if debug:
                     self._dbg_where("(action {})".format(state))
                 action(self, lexer)
-                state = self.stack[-1].state
-                action = self.actions[state]
+                state = stack[-1].state
+                action = actions[state]
                 # Actions should always unwind or do an epsilon transition to a
                 # shift state.
                 assert isinstance(action, dict)
-            if self.replay != []:
-                stv = self.replay.pop()
-                if self.debug:
+            if replay:
+                stv = replay.pop()
+                if debug:
                     self._dbg_where("replay: {}".format(repr(stv.term)))
             else:
                 break
@@ -182,13 +189,12 @@ class Parser:
         # argument should match the content of the parse table, otherwise this
         # would imply that the replay action does not encode a transition from
         # the parse table.
-        state = self.stack[-1].state
+        stack = self.stack
         stv = self.replay.pop()
         if self.debug:
             self._dbg_where("(inline-replay: {})".format(repr(stv.term)))
-        goto = self.actions[state].get(stv.term, ERROR)
-        assert goto == dest
-        self.stack.append(StateTermValue(dest, stv.term, stv.value, stv.new_line))
+        assert self.actions[stack[-1].state].get(stv.term, ERROR) == dest
+        stack.append(StateTermValue(dest, stv.term, stv.value, stv.new_line))
 
     def shift_list(self, stv_list, lexer):
         self.replay.extend(reversed(stv_list))
@@ -276,6 +282,22 @@ class Parser:
         False if it's an error. `t` can be None, querying if we can accept
         end-of-input.
         """
+        # Fast path: when there is nothing to replay, the parse table alone
+        # often answers the question. A terminal with no edge and no error
+        # recovery is an error, and an edge to a shift state is a plain shift.
+        # Edges to actions can still fail after reducing, so those (and error
+        # recovery) are left to the simulator below.
+        if not self.replay:
+            state = self.stack[-1].state
+            row = self.actions[state]
+            if isinstance(row, dict):
+                goto = row.get(t, ERROR)
+                if goto == ERROR:
+                    if self.error_codes[state] is None:
+                        return False
+                elif isinstance(self.actions[goto], dict):
+                    return True
+
         class BogusLexer:
             def throw_unexpected_end(self):
                 raise UnexpectedEndError("")
@@ -60,6 +60,60 @@ def consume(iterator: typing.Iterable[T], progress: bool) -> None:
             sys.stdout.flush()
 
 
+def strongly_connected_components(
+        graph: typing.Mapping[T, typing.Iterable[T]]
+) -> typing.List[typing.List[T]]:
+    """Return the strongly connected components of a directed graph.
+
+    `graph[v]` lists the successors of `v`. Successors which are not keys of
+    `graph` are treated as nodes without successors.
+
+    This is Tarjan's algorithm, using an explicit stack instead of recursion,
+    so that large graphs do not exceed Python's recursion limit. Components are
+    returned in reverse topological order: if an edge goes from one component
+    to another, the latter is listed first."""
+    index: typing.Dict[T, int] = {}
+    lowlink: typing.Dict[T, int] = {}
+    stack: typing.List[T] = []
+    on_stack: typing.Set[T] = set()
+    components: typing.List[typing.List[T]] = []
+
+    def push(v: T) -> typing.Tuple[T, typing.Iterator[T]]:
+        index[v] = lowlink[v] = len(index)
+        stack.append(v)
+        on_stack.add(v)
+        return v, iter(graph.get(v, ()))
+
+    for root in graph:
+        if root in index:
+            continue
+        work = [push(root)]
+        while work:
+            v, successors = work[-1]
+            for w in successors:
+                if w not in index:
+                    work.append(push(w))
+                    break
+                elif w in on_stack:
+                    lowlink[v] = min(lowlink[v], index[w])
+            else:
+                # All successors of v have been visited.
+                work.pop()
+                if work:
+                    u = work[-1][0]
+                    lowlink[u] = min(lowlink[u], lowlink[v])
+                if lowlink[v] == index[v]:
+                    component = []
+                    while True:
+                        w = stack.pop()
+                        on_stack.remove(w)
+                        component.append(w)
+                        if w == v:
+                            break
+                    components.append(component)
+    return components
+
+
 class default_id_dict(dict, typing.Mapping[T, T]):
     def __missing__(self, key) -> T:
         return key
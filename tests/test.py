@@ -408,6 +408,48 @@ class GenTestCase(unittest.TestCase):
              (['b'], {0: None}),
              (['a', 'b'], {})])
 
+    def testStartAndFollowSets(self):
+        # Unit test for rewrites.start_sets and rewrites.follow_sets
+        grammar = Grammar({
+            'expr': [['term', 'tail']],
+            'tail': [['+', 'term', 'tail'], []],
+            'term': [['NUM'], ['(', 'expr', ')'], ['prefix', 'NUM']],
+            'prefix': [[Optional('-')]],
+        }, variable_terminals=['NUM'])
+        canonical = rewrites.CanonicalGrammar(grammar)
+        start = rewrites.start_sets(canonical.grammar)
+        EMPTY = rewrites.EMPTY
+        self.assertEqual(set(start[Nt('expr')]), {'NUM', '(', '-'})
+        self.assertEqual(set(start[Nt('term')]), {'NUM', '(', '-'})
+        self.assertEqual(set(start[Nt('tail')]), {'+', EMPTY})
+        self.assertEqual(set(start[Nt('prefix')]), {'-', EMPTY})
+
+        cache = rewrites.make_start_set_cache(
+            canonical.grammar, canonical.prods, start)
+        follow = rewrites.follow_sets(
+            canonical.grammar, canonical.prods_with_indexes_by_nt, cache)
+        END = rewrites.END
+        self.assertEqual(set(follow[Nt('expr')]), {')', END})
+        self.assertEqual(set(follow[Nt('tail')]), {')', END})
+        self.assertEqual(set(follow[Nt('term')]), {'+', ')', END})
+        self.assertEqual(set(follow[Nt('prefix')]), {'NUM'})
+
+        # `a` and `b` can each end the other, so they share a follow set.
+        grammar = Grammar({
+            'goal': [['a', 'X']],
+            'a': [['Y', 'b'], ['Z']],
+            'b': [['W', 'a'], ['(', 'a', ')']],
+        })
+        canonical = rewrites.CanonicalGrammar(grammar)
+        start = rewrites.start_sets(canonical.grammar)
+        cache = rewrites.make_start_set_cache(
+            canonical.grammar, canonical.prods, start)
+        follow = rewrites.follow_sets(
+            canonical.grammar, canonical.prods_with_indexes_by_nt, cache)
+        self.assertEqual(set(follow[Nt('goal')]), {END})
+        self.assertEqual(set(follow[Nt('a')]), {'X', ')'})
+        self.assertEqual(set(follow[Nt('b')]), {'X', ')'})
+
     def testEmptyGrammar(self):
         tokenize = lexer.LexicalGrammar("X")
         self.compile(tokenize, Grammar({'goal': [[]]}))
@@ -1022,6 +1064,24 @@ class GenTestCase(unittest.TestCase):
         self.compile(tokenize, grammar)
         self.assertParse("! ! ! ! !")
 
+    def testCheckCycleFreeError(self):
+        grammar = Grammar({
+            "problem": [
+                ["!"],
+                ["one"],
+            ],
+            "one": [
+                ["two", Optional("!")],
+            ],
+            "two": [
+                ["problem"],
+            ],
+        })
+        self.assertRaisesRegex(
+            ValueError,
+            r"nonterminal Nt\('problem'\) can produce itself",
+            lambda: gen.compile(grammar))
+
     def testReduceActions(self):
         tokenize = lexer.LexicalGrammar("+ - * / ( )",
                                         NUM=r'[0-9]\w*',
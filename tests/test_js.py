@@ -118,6 +118,13 @@ class ESTestCase(unittest.TestCase):
         self.assert_syntax_error("—x;")
         self.assert_syntax_error("const ONE_THIRD = 1 ÷ 3;")
 
+    def test_syntax_error_position(self):
+        for src in ["x = 1;\nvar y = ;\n", ["x = 1;\nv", "ar y = ;\n"], ["x = 1;\n", "var y = ;\n"]]:
+            with self.assertRaises(jsparagus.lexer.SyntaxError) as cm:
+                self.parse(src)
+            self.assertEqual((cm.exception.lineno, cm.exception.offset, cm.exception.text),
+                             (2, 9, "var y = ;\n"))
+
     def test_regexp(self):
         self.assert_parses(r"/\w/")
         self.assert_parses("/[A-Z]/")
@@ -126,12 +133,17 @@ class ESTestCase(unittest.TestCase):
         self.assert_parses("/**//x*/")
         self.assert_parses("{} /x/")
         self.assert_parses("of / 2")
+        self.assert_parses("x = a\n/ b / c")
+        self.assert_parses("if (a) /x/.test(s)")
 
     def test_incomplete_comments(self):
         self.assert_syntax_error("/*")
         self.assert_syntax_error("/* hello world")
         self.assert_syntax_error("/* hello world *")
+        self.assert_parses("/* a **/ x")
+        self.assert_syntax_error("/* a **/ b */")
         self.assert_parses(["/* hello\n", " world */"])
+        self.assert_parses(["/* hello *", "/ world"])
         self.assert_parses(["// oawfeoiawj", "ioawefoawjie"])
         self.assert_parses(["// oawfeoiawj", "ioawefoawjie\n ok();"])
         self.assert_parses(["// oawfeoiawj", "ioawefoawjie", "jiowaeawojefiw"])